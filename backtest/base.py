@@ -22,8 +22,6 @@ from threading import Thread, Event
 
 from data.futils import thread_available
 
-import copy
-
 # Enum class for backtesting results data order.
 class BTDataEnum(IntEnum):
     """Enum to describe a list with backtesting result."""
@@ -128,6 +126,9 @@ class BackTestData():
         # Data for the calculation
         self._rows = rows
 
+        # Columns parsed from rows on the first use
+        self._columns = None
+
         # Required margin ratio. For example, if the required ration ratio is 0.7 and current financial instrument price is $1000,
         # then at maximum $7000 may be lended by a broker. In case if maximum margin limit is hit, margin call is possible.
         if margin_req < 0:
@@ -185,6 +186,38 @@ class BackTestData():
         """
         return self._rows
 
+    def get_columns(self):
+        """
+            Get columns parsed from data used in calculations. The rows are parsed only once as the columns are used
+            in every calculation cycle.
+
+            Returns:
+                dict: columns of the parsed values (DateTime as datetime objects, Open, High, Low and AdjClose as lists).
+
+            Raises:
+                BackTestError: incorrect date in the provided data.
+        """
+        if self._columns == None:
+            columns = {}
+
+            try:
+                columns[Quotes.DateTime] = [datetime.strptime(row[Quotes.DateTime], '%Y-%m-%d %H:%M:%S') for row in self._rows]
+            except ValueError as e:
+                raise BackTestError(f"Incorrect date in the provided data: {e}") from e
+
+            for key in (Quotes.Open, Quotes.High, Quotes.Low, Quotes.AdjClose):
+                columns[key] = [row[key] for row in self._rows]
+
+            self._columns = columns
+
+        return self._columns
+
+    def reset_columns(self):
+        """
+            Reset parsed columns. Should be called if rows were altered.
+        """
+        self._columns = None
+
     def get_title(self):
         """
             Get symbol title.
@@ -521,14 +554,7 @@ class BackTestOperations():
         if index == None:
             index = self.get_caller_index()
 
-        dt_str = self.get_datetime_str(index)
-
-        try:
-            dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S')
-        except ValueError as e:
-            raise BackTestError(f"The date {dt_str} is incorrect: {e}") from e
-
-        return dt
+        return self.data().get_columns()[Quotes.DateTime][index]
 
     def get_year(self):
         """
@@ -546,7 +572,7 @@ class BackTestOperations():
             Returns:
                 float: the open price at the current index of the calculation.
         """
-        return self.data().get_rows()[self.get_caller_index()][Quotes.Open]
+        return self.data().get_columns()[Quotes.Open][self.get_caller_index()]
 
     def get_close(self):
         """
@@ -555,7 +581,7 @@ class BackTestOperations():
             Returns:
                 float: the close price at the current index of the calculation.
         """
-        return self.data().get_rows()[self.get_caller_index()][Quotes.AdjClose]
+        return self.data().get_columns()[Quotes.AdjClose][self.get_caller_index()]
 
     def get_high(self):
         """
@@ -564,7 +590,7 @@ class BackTestOperations():
             Returns:
                 float: the highest price at the current index of the calculation.
         """
-        return self.data().get_rows()[self.get_caller_index()][Quotes.High]
+        return self.data().get_columns()[Quotes.High][self.get_caller_index()]
 
     def get_low(self):
         """
@@ -573,7 +599,7 @@ class BackTestOperations():
             Returns:
                 float: the lowest price at the current index of the calculation.
         """
-        return self.data().get_rows()[self.get_caller_index()][Quotes.Low]
+        return self.data().get_columns()[Quotes.Low][self.get_caller_index()]
 
     def apply_margin_fee(self):
         """
@@ -691,13 +717,14 @@ class BackTestOperations():
         """
         total_value = 0
 
+        # The price is the same for every position in the current cycle so it is calculated only once
         if self.is_long():
-            total_value += self.get_sell_price() * self._long_positions_cash
-            for j in range(self.get_margin_positions()):
-                total_value += self.get_sell_price() - self._portfolio[j]
+            price = self.get_sell_price()
+            total_value += price * self._long_positions_cash
+            total_value = sum((price - self._portfolio[j] for j in range(self.get_margin_positions())), total_value)
         else:
-            for j in range(self._short_positions):
-                total_value += self._portfolio[j] - self.get_buy_price()
+            price = self.get_buy_price()
+            total_value = sum((self._portfolio[j] - price for j in range(self._short_positions)), total_value)
 
         return total_value
 
@@ -832,8 +859,9 @@ class BackTestOperations():
                 # Close margin positions to meet margin requirement
                 shares_num = 0
 
-                # Copy the initial portfolio to restore if after the calculation
-                initial_portfolio = copy.deepcopy(self._portfolio)
+                # Copy the initial portfolio to restore if after the calculation.
+                # The portfolio holds only position prices, so a shallow copy is sufficient.
+                initial_portfolio = self._portfolio.copy()
 
                 # Estimate how many positions we need to close to meet the margin requirement
                 while deficit > 0 and shares_num < self.get_margin_positions():
@@ -1197,11 +1225,49 @@ class BackTestOperations():
 class BTBaseData():
     """
         Base class to represent backtesting results.
+
+        Rows are accumulated in a list during the calculation and appended to the numpy array only when the data is
+        requested. Columns are stored as contiguous typed arrays which are cached until the data is changed.
     """
     def __init__(self):
         """Initialize the instance of the data class."""
+        # Rows added since the array was built last time
+        self._rows = []
+
         # Numpy array for stored data
-        self.Data = None
+        self._data = None
+
+        # Cached typed columns
+        self._columns = {}
+
+    @property
+    def Data(self):
+        """
+            Get the numpy array with the stored data.
+        """
+        if len(self._rows):
+            rows = np.array(self._rows, dtype='object')
+
+            if self._data is None:
+                self._data = rows
+            else:
+                self._data = np.vstack((self._data, rows))
+
+            self._rows = []
+
+        return self._data
+
+    @Data.setter
+    def Data(self, data):
+        """
+            Set the numpy array with the stored data.
+
+            Args:
+                data(np.array): the data to set.
+        """
+        self._rows = []
+        self._data = data
+        self._columns = {}
 
     def append(self, row):
         """
@@ -1210,10 +1276,28 @@ class BTBaseData():
             Args:
                 row(list): the data to add.
         """
-        if self.Data is None:
-            self.Data = np.array(row, dtype='object')
-        else:
-            self.Data = np.vstack([self.Data, row])
+        self._rows.append(row)
+        self._columns = {}
+
+    def get_column(self, index, dtype='float'):
+        """
+            Get the typed column of the stored data.
+
+            Args:
+                index(int): index of the column.
+                dtype(str): type of the column.
+
+            Returns:
+                np.array: contiguous typed column. The column is read-only as it is shared by all the callers,
+                    use __setitem__() to change the data.
+        """
+        if index not in self._columns:
+            column = np.ascontiguousarray(self.Data[:, index].astype(dtype))
+            column.flags.writeable = False
+
+            self._columns[index] = column
+
+        return self._columns[index]
 
     def __getitem__(self, point):
         """
@@ -1223,18 +1307,19 @@ class BTBaseData():
                 point(list): indexes of the item to get.
         """
         x, y = point
-        return self.Data[x][y]
+        return self.Data[x, y]
 
     def __setitem__(self, point, value):
         """
-            Get the item.
+            Set the item.
 
             Args:
-                point(list): indexes of the item to get.
+                point(list): indexes of the item to set.
                 value: value to set.
         """
         x, y = point
-        self.Data[x][y] = value
+        self.Data[x, y] = value
+        self._columns = {}
 
     def __str__(self):
         """
@@ -1256,57 +1341,56 @@ class BTData(BTBaseData):
 
     @property
     def DateTime(self):
-        return self.Data[:, BTDataEnum.DateTime].astype('str')
+        return self.get_column(BTDataEnum.DateTime, 'str')
 
     @property
     def TotalValue(self):
-        return self.Data[:, BTDataEnum.TotalValue].astype('float')
+        return self.get_column(BTDataEnum.TotalValue, 'float')
 
     @property
     def Deposits(self):
-        return self.Data[:, BTDataEnum.Deposits].astype('float')
+        return self.get_column(BTDataEnum.Deposits, 'float')
 
     @property
     def Cash(self):
-        return self.Data[:, BTDataEnum.Cash].astype('float')
+        return self.get_column(BTDataEnum.Cash, 'float')
 
     @property
     def Borrowed(self):
-        return self.Data[:, BTDataEnum.Borrowed].astype('float')
+        return self.get_column(BTDataEnum.Borrowed, 'float')
 
     @property
     def OtherProfit(self):
-        return self.Data[:, BTDataEnum.OtherProfit].astype('float')
+        return self.get_column(BTDataEnum.OtherProfit, 'float')
 
     @property
     def CommissionExpense(self):
-        return self.Data[:, BTDataEnum.CommissionExpense].astype('float')
+        return self.get_column(BTDataEnum.CommissionExpense, 'float')
 
     @property
     def SpreadExpense(self):
-        return self.Data[:, BTDataEnum.SpreadExpense].astype('float')
+        return self.get_column(BTDataEnum.SpreadExpense, 'float')
 
     @property
     def DebtExpense(self):
-        return self.Data[:, BTDataEnum.DebtExpense].astype('float')
+        return self.get_column(BTDataEnum.DebtExpense, 'float')
 
     @property
     def OtherExpense(self):
-        return self.Data[:, BTDataEnum.OtherExpense].astype('float')
+        return self.get_column(BTDataEnum.OtherExpense, 'float')
 
     @property
     def TotalExpenses(self):
-        return self.Data[:, BTDataEnum.TotalExpenses].astype('float')
+        return self.get_column(BTDataEnum.TotalExpenses, 'float')
 
     @property
     def TotalTrades(self):
-        return self.Data[:, BTDataEnum.TotalTrades].astype('float')
+        return self.get_column(BTDataEnum.TotalTrades, 'float')
 
     @TotalTrades.setter
     def TotalTrades(self, data):
         """
-            Workaround to prevent the automatic copying of column. Python may make a copy of the column and then
-            changing the value will only change the value in the copy but not in the actual array.
+            Set the value of the column as the column itself is read-only.
 
             Args:
                 data(int, float): index and the value to set the actual column.
@@ -1316,7 +1400,7 @@ class BTData(BTBaseData):
         except ValueError as e:
             raise ValueError("Iterable with two items is required to set the value.") from e
         else:
-            self.Data[idx][BTDataEnum.TotalTrades] = value
+            self[idx, BTDataEnum.TotalTrades] = value
 
 class BTSymbol(BTBaseData):
     """
@@ -1332,65 +1416,64 @@ class BTSymbol(BTBaseData):
 
     @property
     def Open(self):
-        return self.Data[:, BTSymbolEnum.Open].astype('float')
+        return self.get_column(BTSymbolEnum.Open, 'float')
 
     @property
     def Close(self):
-        return self.Data[:, BTSymbolEnum.Close].astype('float')
+        return self.get_column(BTSymbolEnum.Close, 'float')
 
     @property
     def High(self):
-        return self.Data[:, BTSymbolEnum.High].astype('float')
+        return self.get_column(BTSymbolEnum.High, 'float')
 
     @property
     def Low(self):
-        return self.Data[:, BTSymbolEnum.Low].astype('float')
+        return self.get_column(BTSymbolEnum.Low, 'float')
 
     @property
     def PriceOpenLong(self):
-        return self.Data[:, BTSymbolEnum.PriceOpenLong].astype('float')
+        return self.get_column(BTSymbolEnum.PriceOpenLong, 'float')
 
     @property
     def PriceCloseLong(self):
-        return self.Data[:, BTSymbolEnum.PriceCloseLong].astype('float')
+        return self.get_column(BTSymbolEnum.PriceCloseLong, 'float')
 
     @property
     def PriceOpenShort(self):
-        return self.Data[:, BTSymbolEnum.PriceOpenShort].astype('float')
+        return self.get_column(BTSymbolEnum.PriceOpenShort, 'float')
 
     @property
     def PriceCloseShort(self):
-        return self.Data[:, BTSymbolEnum.PriceCloseShort].astype('float')
+        return self.get_column(BTSymbolEnum.PriceCloseShort, 'float')
 
     @property
     def PriceMarginReqLong(self):
-        return self.Data[:, BTSymbolEnum.PriceMarginReqLong].astype('float')
+        return self.get_column(BTSymbolEnum.PriceMarginReqLong, 'float')
 
     @property
     def PriceMarginReqShort(self):
-        return self.Data[:, BTSymbolEnum.PriceMarginReqShort].astype('float')
+        return self.get_column(BTSymbolEnum.PriceMarginReqShort, 'float')
 
     @property
     def LongPositions(self):
-        return self.Data[:, BTSymbolEnum.LongPositions].astype('int')
+        return self.get_column(BTSymbolEnum.LongPositions, 'int')
 
     @property
     def ShortPositions(self):
-        return self.Data[:, BTSymbolEnum.ShortPositions].astype('int')
+        return self.get_column(BTSymbolEnum.ShortPositions, 'int')
 
     @property
     def MarginPositions(self):
-        return self.Data[:, BTSymbolEnum.MarginPositions].astype('int')
+        return self.get_column(BTSymbolEnum.MarginPositions, 'int')
 
     @property
     def TradesNo(self):
-        return self.Data[:, BTSymbolEnum.TradesNo].astype('float')
+        return self.get_column(BTSymbolEnum.TradesNo, 'float')
 
     @TradesNo.setter
     def TradesNo(self, data):
         """
-            Workaround to prevent the automatic copying of column. Python may make a copy of the column and then
-            changing the value will only change the value in the copy but not in the actual array.
+            Set the value of the column as the column itself is read-only.
 
             Args:
                 data(int, float): index and the value to set the actual column.
@@ -1400,7 +1483,7 @@ class BTSymbol(BTBaseData):
         except ValueError as e:
             raise ValueError("Iterable with two items is required to set the value.") from e
         else:
-            self.Data[idx][BTSymbolEnum.TradesNo] = value
+            self[idx, BTSymbolEnum.TradesNo] = value
 
 ########################
 # Base backtesting class
@@ -1588,6 +1671,9 @@ class BackTest(metaclass=abc.ABCMeta):
         # Separate thread for calculation
         self.__thread = None
 
+        # Exception raised during the calculation in a separate thread
+        self.__error = None
+
     #############
     # Methods
     #############
@@ -1618,7 +1704,7 @@ class BackTest(metaclass=abc.ABCMeta):
                 list: the results of the calculation.
 
             Reises:
-                BackTestError: results were requested but calculation is not performed.
+                BackTestError: results were requested but calculation is not performed or it failed.
         """
         if self.__event == None:
             raise BackTestError("Calulation was not performed.")
@@ -1629,11 +1715,16 @@ class BackTest(metaclass=abc.ABCMeta):
             self.__thread.join()
             self.__thread = None
 
+        if self.__error != None:
+            raise self.__error
+
         if result == False:
             raise BackTestError(f"Timeout ({self.__timeout} sec) has happened. Calculation is not finished.")
 
-        for ex in self.__exec:
-            self._results.Symbols.append(ex.get_sym_results())
+        # Results are returned without copying, so symbol results should be added only when they are requested for the first time
+        if len(self._results.Symbols) == 0:
+            for ex in self.__exec:
+                self._results.Symbols.append(ex.get_sym_results())
 
         return self._results
 
@@ -2194,37 +2285,36 @@ class BackTest(metaclass=abc.ABCMeta):
         # Needs a bit tricky implementation to handle python's automatic copying of objects
         # At first we need to remove all the entries where DateTime does not present in each symbol's data
         if all_execs > 1:
-            dts_to_remove = []
+            dts = [np.array([row[Quotes.DateTime] for row in ex.data().get_rows()]) for ex in self.all_exec()]
 
-            for i in range(all_execs):
-                for j in range(len(self.exec(i).data().get_rows())):
-                    dt = self.exec(i).data().get_rows()[j][Quotes.DateTime]
+            # Datetimes which present in each symbol's data
+            common_dts = dts[0]
 
-                    for ex in self.all_exec():
-                        dts2 = [row2[Quotes.DateTime] for row2 in ex.data().get_rows()]
-                        
-                        if dt not in dts2:
-                            dts_to_remove.append(dt)
+            for ex_dts in dts[1:]:
+                common_dts = np.intersect1d(common_dts, ex_dts)
 
-            for dt in dts_to_remove:
-                for ex in self.all_exec():
-                    for i in range(len(ex.data().get_rows())):
-                        if ex.data().get_rows()[i][Quotes.DateTime] == dt:
-                            del ex.data().get_rows()[i]
-                            break
+            for i in range(all_execs):
+                mask = np.isin(dts[i], common_dts)
 
-            length = len(self.exec().data().get_rows())
+                if mask.all() == False:
+                    # Rows should be altered in place as the list is shared with the data instance
+                    rows = self.exec(i).data().get_rows()
+                    rows[:] = [row for row, keep in zip(rows, mask) if keep]
+                    self.exec(i).data().reset_columns()
+                    dts[i] = dts[i][mask]
 
             # Check data integrity
-            for i in range(length):
-                dt = self.exec().data().get_rows()[i][Quotes.DateTime]
+            for j in range(1, all_execs):
+                ex = self.exec(j)
+
+                if len(dts[j]) != len(dts[0]):
+                    raise BackTestError(f"Data length misintegrity found. {len(dts[0])} of {self.exec().data().get_title()} != {len(dts[j])} of {ex.data().get_title()}")
+
+                misintegrity = np.flatnonzero(dts[j] != dts[0])
 
-                for j in range(1, all_execs):
-                    ex = self.exec(j)
-                    ex_row = ex.data().get_rows()[i]
-                    ex_dt = ex_row[Quotes.DateTime]
-                    if ex_dt != dt:
-                        raise BackTestError(f"Date misintegrity found at index {i}. {dt} of {self.exec().data().get_title()} != {ex_dt} of {ex.data().get_title()}")
+                if len(misintegrity):
+                    i = misintegrity[0]
+                    raise BackTestError(f"Date misintegrity found at index {i}. {dts[0][i]} of {self.exec().data().get_title()} != {dts[j][i]} of {ex.data().get_title()}")
 
         # Calculate technical data for each symbol
         self.calculate_all_tech()
@@ -2354,6 +2444,7 @@ class BackTest(metaclass=abc.ABCMeta):
             Perform the calculation of the entire strategy.
         """
         self.__event = BackTestEvent(self.__timeout)
+        self.__error = None
 
         if thread_available():
             self.__thread = Thread(target=self.__do_calculation)
@@ -2363,10 +2454,12 @@ class BackTest(metaclass=abc.ABCMeta):
 
     def __do_calculation(self):
         # Catch any exception which happens in a thread to finish the thread soon then.
+        # The exception is kept to be re-raised in the caller's thread when the results are requested.
         try:
             self.do_calculation()
         except Exception as e:
-            raise BackTestError(e) from e
+            self.__error = BackTestError(e)
+            raise self.__error from e
         finally:
             self.__event.set()
 
@@ -35,12 +35,12 @@ class BuyAndHold(BackTest):
         self.setup()
 
         # Iterate through all rows and calculate the required values
-        for row in rows:
+        for index in range(len(rows)):
             ####################################################################################################
             # Setup cycle calculations if current cycle shouldn't be skipped (because of offset or lack of data)
             ####################################################################################################
 
-            if self.do_cycle(rows.index(row)) == False:
+            if self.do_cycle(index) == False:
                 continue
 
             ########################
@@ -10,8 +10,8 @@ from backtest.base import BackTestError
 
 from data.fvalues import Quotes
 
+import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
 class MA(BackTest):
     """
@@ -79,13 +79,37 @@ class MA(BackTest):
             Args:
                 ex(BackTestOperations): Operations instance class.
         """
-        df = pd.DataFrame(ex.data().get_rows())
-
         if self.__is_simple:
-            ex.append_calc_data(ta.sma(df[Quotes.AdjClose], length = self._period))
+            closes = np.array([row[Quotes.AdjClose] for row in ex.data().get_rows()], dtype=np.float64)
+            ex.append_calc_data(self.get_sma(closes, self._period))
         else:
+            import pandas_ta as ta
+
+            df = pd.DataFrame(ex.data().get_rows())
             ex.append_calc_data(ta.ema(df[Quotes.AdjClose], length = self._period))
 
+    @staticmethod
+    def get_sma(closes, period):
+        """
+            Calculate simple moving average using cumulative sums instead of a rolling window.
+
+            Args:
+                closes(np.ndarray): close prices.
+                period(int): period for moving average.
+
+            Returns:
+                np.ndarray: SMA values. The first period - 1 values are NaN.
+        """
+        ma = np.full(len(closes), np.nan)
+
+        if period == 0 or len(closes) < period:
+            return ma
+
+        csum = np.cumsum(closes)
+        ma[period - 1:] = (csum[period - 1:] - np.concatenate(([0], csum[:-period]))) / period
+
+        return ma
+
     def do_calculation(self):
         """
             Perform strategy calculation.
@@ -108,13 +132,13 @@ class MA(BackTest):
         # Iterate through all rows and calculate the required values
         ############################################################
 
-        for row in rows:
+        for index in range(length):
 
             ####################################################################################################
             # Setup cycle calculations if current cycle shouldn't be skipped (because of offset or lack of data)
             ####################################################################################################
 
-            if self.do_cycle(rows.index(row)) == False:
+            if self.do_cycle(index) == False:
                 continue
 
             ############################################################################
@@ -6,20 +6,62 @@ Distributed under Fcore License 1.1 (see license.md)
 """
 from data.futils import write_image, open_image
 
-import plotly.graph_objects as go
-from plotly import subplots
-
-from PIL import Image
-from PIL import ImageFont
-from PIL import ImageDraw
+# Plotly, PIL and matplotlib are imported in the methods which use them as these imports are heavy.
 
 from enum import IntEnum
 
 import io
 
-from matplotlib import font_manager
+import multiprocessing
+
+import numpy as np
+
+from functools import lru_cache
+
+from threading import Thread, Lock
+
+@lru_cache(maxsize=8)
+def load_font(family, weight, size):
+    """
+        Load the font. The result is cached as font lookup and parsing are expensive.
+
+        Args:
+            family(str): font family.
+            weight(str): font weight.
+            size(int): font size.
+
+        Returns:
+            ImageFont.FreeTypeFont: the loaded font.
+    """
+    from matplotlib import font_manager
+    from PIL import ImageFont
+
+    path = font_manager.findfont(font_manager.FontProperties(family=family, weight=weight))
+
+    return ImageFont.truetype(path, size)
+
+# Indicates if fonts warming up has been already started
+_fonts_warming = False
+_fonts_warming_lock = Lock()
+
+def warm_up_fonts():
+    """
+        Load the fonts used in annotations in a background thread. The first font lookup builds matplotlib font cache
+        which may take seconds, so it is better to do it while charts are being built.
+    """
+    global _fonts_warming
+
+    with _fonts_warming_lock:
+        if _fonts_warming:
+            return
+
+        _fonts_warming = True
 
-from math import ceil
+    def warm_up():
+        load_font('monospace', 'regular', 22)
+        load_font('monospace', 'bold', 22)
+
+    Thread(target=warm_up, daemon=True).start()
 
 class ChartType(IntEnum):
     Line = 0
@@ -29,6 +71,66 @@ class ChartType(IntEnum):
 class ReportsError(Exception):
     """Exception class for reporting."""
 
+def render_kaleido(fig_dicts):
+    """
+        Render the charts using Kaleido 1.x. All the charts are rendered in a single browser session instead of
+        starting a new browser for each chart. The charts are rendered concurrently, each in a separate tab.
+
+        Args:
+            fig_dicts(list): charts (as dictionaries) to render.
+
+        Returns:
+            list: PNG images of the charts in the same order.
+
+        Raises:
+            ReportsError: Kaleido or Chrome required by Kaleido is not available.
+    """
+    import asyncio
+    import plotly.io as pio
+
+    try:
+        import kaleido
+        from kaleido.errors import ChromeNotFoundError
+    except ImportError as e:
+        raise ReportsError("Kaleido is required to render the charts.") from e
+
+    def get_opts(fig_dict):
+        layout = fig_dict.get('layout', {})
+
+        return dict(format='png',
+                    width=layout.get('width') or pio.defaults.default_width,
+                    height=layout.get('height') or pio.defaults.default_height,
+                    scale=1)
+
+    # Browser tabs are rendered by separate processes, so the number of tabs is limited by the number of CPUs
+    tabs = max(1, min(len(fig_dicts), multiprocessing.cpu_count()))
+
+    async def render():
+        async with kaleido.Kaleido(n=tabs) as k:
+            # The order of the images is kept by gather()
+            return await asyncio.gather(*(k.calc_fig(fig_dict, opts=get_opts(fig_dict)) for fig_dict in fig_dicts))
+
+    result = {}
+
+    def run():
+        try:
+            result['images'] = asyncio.run(render())
+        except Exception as e:
+            result['error'] = e
+
+    # asyncio.run() can't be called if the caller already runs an event loop (like Jupyter), so a separate thread is used.
+    thread = Thread(target=run)
+    thread.start()
+    thread.join()
+
+    if 'error' in result:
+        if isinstance(result['error'], ChromeNotFoundError):
+            raise ReportsError("Chrome is required by Kaleido to render the charts. Install it using plotly_get_chrome.") from result['error']
+
+        raise result['error']
+
+    return result['images']
+
 class Report():
     """The reporting class."""
     def __init__(self, data, width, margin=False, color="LightSteelBlue"):
@@ -65,6 +167,12 @@ class Report():
         self._annotation_height = 170
         self._annotation_width = 1000
 
+        # Datetime range of the default dataset. It is calculated on the first use.
+        self._dt_range = None
+
+        # Fonts are needed only for annotations but loading them for the first time is slow
+        warm_up_fonts()
+
     def get_charts_num(self, fig):
         """
             Get the number of subcharts in the fugure.
@@ -83,6 +191,134 @@ class Report():
 
         return num
 
+    def render_charts(self, figs):
+        """
+            Render the charts to images. All the charts are rendered by the same Kaleido process (concurrently on Kaleido 1.x).
+
+            Args:
+                figs(list): charts (go.Figure) to render.
+
+            Returns:
+                list: decoded images (PIL.Image) of the charts in the same order.
+
+            Raises:
+                ReportsError: Kaleido is not available.
+        """
+        import plotly.io as pio
+        from PIL import Image
+
+        fig_dicts = [fig.to_dict() for fig in figs]
+
+        if hasattr(pio.kaleido, 'scope'):
+            # Kaleido 0.x keeps a single rendering process in the scope
+            if pio.kaleido.scope is None:
+                raise ReportsError("Kaleido is required to render the charts.")
+
+            images = [pio.kaleido.scope.transform(fig_dict, format="png") for fig_dict in fig_dicts]
+        else:
+            images = render_kaleido(fig_dicts)
+
+        # The images are converted to the mode of the resulting image so pasting is a plain copy of pixels.
+        return [Image.open(io.BytesIO(image)).convert('RGB') for image in images]
+
+    def downsample(self, x, y):
+        """
+            Downsample the series to the resolution of the chart using MinMax aggregation. The series is split into buckets
+            and minimum and maximum values of each bucket are kept (in the original order). The first and the last points
+            are always kept so the series is not shortened.
+
+            Args:
+                x(np.array): values of x axis.
+                y(np.array): values of y axis.
+
+            Returns:
+                np.array, np.array: downsampled values of x and y axes.
+        """
+        y = np.asarray(y, dtype='float')
+        length = len(y)
+
+        # Two points (minimum and maximum) per bucket
+        buckets = self._width
+
+        if length <= buckets * 2:
+            return x, y
+
+        bucket_size = -(-length // buckets)
+
+        # Pad the series to fit the buckets. NaNs should not be selected as extremes.
+        padded = np.full(buckets * bucket_size, np.nan)
+        padded[:length] = y
+        padded = padded.reshape(buckets, bucket_size)
+        is_nan = np.isnan(padded)
+
+        offsets = np.arange(buckets) * bucket_size
+        min_idx = offsets + np.where(is_nan, np.inf, padded).argmin(axis=1)
+        max_idx = offsets + np.where(is_nan, -np.inf, padded).argmax(axis=1)
+
+        idx = np.unique(np.concatenate([[0, length - 1], min_idx, max_idx]))
+        idx = idx[idx < length]
+
+        return np.asarray(x)[idx], y[idx]
+
+    def get_line_trace(self, x, y, name, **kwargs):
+        """
+            Get the line trace with the series downsampled to the resolution of the chart.
+
+            Args:
+                x(np.array): values of x axis.
+                y(np.array): values of y axis.
+                name(str): name of the trace.
+                kwargs: other arguments of go.Scatter.
+
+            Returns:
+                go.Scatter: line trace.
+        """
+        import plotly.graph_objects as go
+
+        x, y = self.downsample(x, y)
+
+        # Single precision is far beyond the resolution of the chart and it halves the size of the serialized series
+        return go.Scatter(x=np.ascontiguousarray(x), y=np.ascontiguousarray(y, dtype=np.float32), mode='lines', name=name, **kwargs)
+
+    def get_markers_trace(self, x, y, name, marker):
+        """
+            Get the markers trace. Only the points with actual values are used as the series is mostly NaN.
+
+            Args:
+                x(np.array): values of x axis.
+                y(np.array): values of y axis.
+                name(str): name of the trace.
+                marker(dict): marker style.
+
+            Returns:
+                go.Scatter: markers trace.
+        """
+        import plotly.graph_objects as go
+
+        y = np.asarray(y, dtype='float')
+        mask = ~np.isnan(y)
+
+        return go.Scatter(x=np.asarray(x)[mask], y=y[mask].astype(np.float32), mode='markers', marker=marker, name=name)
+
+    def get_dt_range(self, data):
+        """
+            Get the datetime range of the data. The range of the default dataset is cached.
+
+            Args:
+                data(BtData): data to get the range.
+
+            Returns:
+                list: the first and the last datetimes of the data.
+        """
+        if data is not self._data:
+            return [data.DateTime[0], data.DateTime[-1]]
+
+        if self._dt_range is None:
+            dts = data.DateTime
+            self._dt_range = [dts[0], dts[-1]]
+
+        return self._dt_range
+
     def update_layout(self, fig, title, height=600):
         """
             Update layout for a chart.
@@ -131,6 +367,9 @@ class Report():
             Returns:
                 go.figure: created figure.
         """
+        import plotly.graph_objects as go
+        from plotly import subplots
+
         if data is None:
             data = self._data
 
@@ -142,10 +381,7 @@ class Report():
             fig = subplots.make_subplots(subplot_titles=[symbol.Title])
 
         if chart_type == ChartType.Line:
-            fig.add_trace(go.Scatter(x=data.DateTime,
-                                     y=symbol.Close,
-                                     mode='lines',
-                                     name='Quotes'))
+            fig.add_trace(self.get_line_trace(data.DateTime, symbol.Close, 'Quotes'))
         elif chart_type == ChartType.Candle:
             fig.add_trace(go.Candlestick(x=data.DateTime,
                                          open=symbol.Open,
@@ -165,47 +401,41 @@ class Report():
 
             fig.update_layout(xaxis_rangeslider_visible=False)
 
-        fig.add_trace(go.Scatter(x=data.DateTime,
-                                 y=symbol.PriceOpenLong,
-                                 mode='markers',
-                                 marker=dict(size=12, symbol="arrow-up", color='green', line_color="midnightblue", line_width=2),
-                                 name='Open Long'))
+        fig.add_trace(self.get_markers_trace(x=data.DateTime,
+                                             y=symbol.PriceOpenLong,
+                                             marker=dict(size=12, symbol="arrow-up", color='green', line_color="midnightblue", line_width=2),
+                                             name='Open Long'))
 
-        fig.add_trace(go.Scatter(x=data.DateTime,
-                                 y=symbol.PriceCloseLong,
-                                 mode='markers',
-                                 marker=dict(size=12, symbol="arrow-down", color='red', line_color="midnightblue", line_width=2),
-                                 name='Close Long'))
+        fig.add_trace(self.get_markers_trace(x=data.DateTime,
+                                             y=symbol.PriceCloseLong,
+                                             marker=dict(size=12, symbol="arrow-down", color='red', line_color="midnightblue", line_width=2),
+                                             name='Close Long'))
 
         if self._margin is True:
-            fig.add_trace(go.Scatter(x=data.DateTime,
-                                     y=symbol.PriceOpenShort,
-                                     mode='markers',
-                                     marker=dict(size=12, symbol="arrow-right", color='purple', line_color="midnightblue", line_width=2),
-                                     name='Open Short'))
-
-            fig.add_trace(go.Scatter(x=data.DateTime,
-                                     y=symbol.PriceCloseShort,
-                                     mode='markers',
-                                     marker=dict(size=12, symbol="arrow-left", color='yellow', line_color="midnightblue", line_width=2),
-                                     name='Close Short'))
-
-            fig.add_trace(go.Scatter(x=data.DateTime,
-                                     y=symbol.PriceMarginReqLong,
-                                     mode='markers',
-                                     marker=dict(size=12, symbol="hourglass", line_color="midnightblue", line_width=2),
-                                     name='Margin Req Close Long'))
-
-            fig.add_trace(go.Scatter(x=data.DateTime,
-                                     y=symbol.PriceMarginReqShort,
-                                     mode='markers',
-                                     marker=dict(size=12, symbol="bowtie", line_color="midnightblue", line_width=2),
-                                     name='Margin Req Close Short'))
+            fig.add_trace(self.get_markers_trace(x=data.DateTime,
+                                                 y=symbol.PriceOpenShort,
+                                                 marker=dict(size=12, symbol="arrow-right", color='purple', line_color="midnightblue", line_width=2),
+                                                 name='Open Short'))
+
+            fig.add_trace(self.get_markers_trace(x=data.DateTime,
+                                                 y=symbol.PriceCloseShort,
+                                                 marker=dict(size=12, symbol="arrow-left", color='yellow', line_color="midnightblue", line_width=2),
+                                                 name='Close Short'))
+
+            fig.add_trace(self.get_markers_trace(x=data.DateTime,
+                                                 y=symbol.PriceMarginReqLong,
+                                                 marker=dict(size=12, symbol="hourglass", line_color="midnightblue", line_width=2),
+                                                 name='Margin Req Close Long'))
+
+            fig.add_trace(self.get_markers_trace(x=data.DateTime,
+                                                 y=symbol.PriceMarginReqShort,
+                                                 marker=dict(size=12, symbol="bowtie", line_color="midnightblue", line_width=2),
+                                                 name='Margin Req Close Short'))
 
         self.update_layout(fig=fig, title=title, height=height)
 
         # Workaround to handle plotly whitespace issue when adding markers
-        fig.update_layout(xaxis={"range":[data.DateTime[0], data.DateTime[-1]]})
+        fig.layout.xaxis.range = self.get_dt_range(data)
 
         self._charts.append(fig)
 
@@ -223,6 +453,8 @@ class Report():
             Returns:
                 go.figure: created figure.
         """
+        import plotly.graph_objects as go
+
         if data is None:
             data = self._data
 
@@ -230,13 +462,13 @@ class Report():
             # Create the default figure
             fig = go.Figure()
 
-            fig.add_trace(go.Scatter(x=data.DateTime, y=data.TotalExpenses, mode='lines', name="Expenses"))
-            fig.add_trace(go.Scatter(x=data.DateTime, y=data.CommissionExpense, mode='lines', name="Commission"))
-            fig.add_trace(go.Scatter(x=data.DateTime, y=data.SpreadExpense, mode='lines', name="Spread"))
+            fig.add_trace(self.get_line_trace(data.DateTime, data.TotalExpenses, "Expenses"))
+            fig.add_trace(self.get_line_trace(data.DateTime, data.CommissionExpense, "Commission"))
+            fig.add_trace(self.get_line_trace(data.DateTime, data.SpreadExpense, "Spread"))
 
             if self._margin is True:
-                fig.add_trace(go.Scatter(x=data.DateTime, y=data.DebtExpense, mode='lines', name="Margin Expenses"))
-                fig.add_trace(go.Scatter(x=data.DateTime, y=data.OtherExpense, mode='lines', name="Yield Expenses"))
+                fig.add_trace(self.get_line_trace(data.DateTime, data.DebtExpense, "Margin Expenses"))
+                fig.add_trace(self.get_line_trace(data.DateTime, data.OtherExpense, "Yield Expenses"))
 
         self.update_layout(fig=fig, title=title, height=height)
         self._charts.append(fig)
@@ -255,6 +487,8 @@ class Report():
             Returns:
                 go.figure: created figure.
         """
+        import plotly.graph_objects as go
+
         if data is None:
             data = self._data
 
@@ -262,9 +496,9 @@ class Report():
             # Create the default figure
             fig = go.Figure()
 
-        fig.add_trace(go.Scatter(x=data.DateTime, y=data.TotalValue, mode='lines', name="Total Value"))
-        fig.add_trace(go.Scatter(x=data.DateTime, y=data.Deposits, mode='lines', name="Deposits"))
-        fig.add_trace(go.Scatter(x=data.DateTime, y=data.OtherProfit, mode='lines', name="Dividends"))
+        fig.add_trace(self.get_line_trace(data.DateTime, data.TotalValue, "Total Value"))
+        fig.add_trace(self.get_line_trace(data.DateTime, data.Deposits, "Deposits"))
+        fig.add_trace(self.get_line_trace(data.DateTime, data.OtherProfit, "Dividends"))
 
         self.update_layout(fig=fig, title=title, height=height)
         self._charts.append(fig)
@@ -284,6 +518,8 @@ class Report():
             Returns:
                 go.figure: created figure.
         """
+        import plotly.graph_objects as go
+
         if data is None:
             data = self._data
 
@@ -291,11 +527,13 @@ class Report():
             # Create the default figure
             fig = go.Figure()
 
-        fig.add_trace(go.Scatter(x=data.DateTime, y=data.TotalTrades, mode='lines', name="Total Trades"))
+        dts = data.DateTime
+
+        # Get trades statistics of all the symbols and add the traces at once
+        traces = [self.get_line_trace(dts, data.TotalTrades, "Total Trades")] + \
+                 [self.get_line_trace(dts, symbol.TradesNo, f"{symbol.Title} Trades") for symbol in data.Symbols]
 
-        # Iterate through all charts to get trades statistics
-        for symbol in data.Symbols:
-            fig.add_trace(go.Scatter(x=data.DateTime, y=symbol.TradesNo, mode='lines', name=f"{symbol.Title} Trades"))
+        fig.add_traces(traces)
 
         self.update_layout(fig=fig, title=title, height=height)
         self._charts.append(fig)
@@ -328,6 +566,9 @@ class Report():
             Returns:
                 str: The annotation in string form.
         """
+        from PIL import Image
+        from PIL import ImageDraw
+
         if data is None:
             data = self._data
 
@@ -359,16 +600,12 @@ class Report():
         draw = ImageDraw.Draw(result)
 
         # Find the font to use on each platform
-        font_type = font_manager.FontProperties(family='monospace', weight='regular')
-        path = font_manager.findfont(font_type)
-        font = ImageFont.truetype(path, 22)
-        
+        font = load_font('monospace', 'regular', 22)
+
         y_offset = 15
 
         if title != None:
-            bold_font_type = font_manager.FontProperties(family='monospace', weight='bold')
-            bold_path = font_manager.findfont(bold_font_type)
-            bold_font = ImageFont.truetype(bold_path, 22)
+            bold_font = load_font('monospace', 'bold', 22)
 
             draw.text((50, 5), title, (54, 69, 79), font=bold_font)
             y_offset = 35
@@ -389,36 +626,42 @@ class Report():
             Returns:
                 byteimage(PNG): the combined byte image of all charts.
         """
+        from PIL import Image
+
         if len(self._charts) == 0:
             raise ReportsError("No charts are generated yet.")
 
         # Get the width of the resulting image
         width = self._charts[0].layout.width
 
-        images = []
-        height = 0
+        images = self.render_charts(self._charts)
 
-        # Iterate through all the charts to get byteimages and calculate sizes
-        for fig in self._charts:
-            images.append(fig.to_image(format="png"))
-            height += fig.layout.height
+        height = sum(img.height for img in images)
 
         # Add height of annotations
-        img_per_row = int(self._width / self._annotation_width)
-        annotations_height = ceil(len(self._annotations) / img_per_row) * self._annotation_height
+        img_per_row = max(1, self._width // self._annotation_width)
+        rows = (len(self._annotations) + img_per_row - 1) // img_per_row
 
-        height += int(annotations_height)
+        height += rows * self._annotation_height
 
-        # Create the resulting image
-        result = Image.new('RGB', (width, height))
+        # Allocate the buffer for the resulting image at once. Uncovered areas stay black.
+        buffer = np.zeros((height, width, 3), dtype=np.uint8)
+
+        def paste(img, x, y):
+            # Copy the pixels to the buffer cropping the parts which do not fit
+            arr = np.asarray(img)
+            h = min(arr.shape[0], height - y)
+            w = min(arr.shape[1], width - x)
+
+            if h > 0 and w > 0:
+                buffer[y:y + h, x:x + w] = arr[:h, :w]
 
         # The variable to store the current vertical image position
         y = 0
 
         # Iterate through images to append them one after another
-        for image in images:
-            img = Image.open(io.BytesIO(image))
-            result.paste(img, (0, y))
+        for img in images:
+            paste(img, 0, y)
             y += img.height
 
         # The variable to store the current horizontal position
@@ -426,7 +669,7 @@ class Report():
 
         # Iterate through annotations images to append them one after another
         for annotation in self._annotations:
-            result.paste(annotation, (x, y))
+            paste(annotation, x, y)
 
             x += self._annotation_width
 
@@ -434,6 +677,8 @@ class Report():
                 x = 0 
                 y += self._annotation_height
 
+        result = Image.fromarray(buffer)
+
         return result
 
     def show_image(self):
@@ -18,6 +18,21 @@ import settings
 # Current database compatibility version
 DB_VERSION = 6
 
+def get_sql_value(value):
+    """
+        Get the value to be used as a query parameter. 'NULL' placeholders used by API wrappers are converted to None.
+
+        Args:
+            value: the value to convert.
+
+        Returns:
+            The value for the query parameter.
+    """
+    if isinstance(value, str) and value == 'NULL':
+        return None
+
+    return value
+
 class FdataError(Exception):
     """
         Base data exception class.
@@ -825,12 +840,13 @@ class ReadOnlyData():
         """
         self.check_if_connected()
 
-        num_query = f"""SELECT COUNT(*) FROM quotes WHERE symbol_id =
-                        (SELECT symbol_id FROM symbols where ticker = '{self.symbol}') AND
-                        time_stamp >= {self.first_date_ts} AND time_stamp <= {self.last_date_ts};"""
+        # The query is resolved as a range search on idx_quotes. Values are bound to reuse the prepared statement.
+        num_query = """SELECT COUNT(*) FROM quotes WHERE symbol_id =
+                        (SELECT symbol_id FROM symbols where ticker = (?)) AND
+                        time_stamp >= (?) AND time_stamp <= (?);"""
 
         try:
-            self.cur.execute(num_query)
+            self.cur.execute(num_query, (self.symbol, self.first_date_ts, self.last_date_ts))
         except self.Error as e:
             raise FdataError(f"Can't execute a query on a table 'quotes': {e}\n{num_query}") from e
 
@@ -960,21 +976,14 @@ class ReadWriteData(ReadOnlyData):
         except self.Error as e:
             raise FdataError(f"Can't execute a query on a table 'symbols': {e}\n{delete_symbol}") from e
 
-    def _add_base_quote_data(self, quote):
+    def _get_base_quote_query(self):
         """
-            Add base quote data (similar for all security types) to the database but do not perform commit.
-
-            Args:
-                quotes_dict(list of dictionaries): quotes obtained from an API wrapper.
+            Get the parametrized query to add base quote data. The query text does not depend on a quote,
+            so the statement is compiled once and reused for all the quotes.
 
             Returns:
-                int: last row id of the operation.
-
-            Raises:
-                FdataError: sql error happened.
+                str: the query to add base quote data.
         """
-        self.check_if_connected()
-
         insert_quote = f"""INSERT OR {self._update} INTO quotes (symbol_id,
                                                                     source_id,
                                                                     time_stamp,
@@ -988,27 +997,91 @@ class ReadWriteData(ReadOnlyData):
                                                                     volume,
                                                                     transactions)
                             VALUES (
-                            (SELECT symbol_id FROM symbols WHERE ticker = '{self.symbol}'),
-                            (SELECT source_id FROM sources WHERE title = '{self.source_title}'),
-                            ({quote['ts']}),
-                            (SELECT time_span_id FROM timespans WHERE title = '{self.timespan}' COLLATE NOCASE),
-                            (SELECT sec_type_id FROM sectypes WHERE title = '{quote['sectype']}' COLLATE NOCASE),
-                            (SELECT currency_id FROM currency WHERE title = '{quote['currency']}' COLLATE NOCASE),
-                            ({quote['open']}),
-                            ({quote['high']}),
-                            ({quote['low']}),
-                            ({quote['adj_close']}),
-                            ({quote['volume']}),
-                            ({quote['transactions']})
+                            (SELECT symbol_id FROM symbols WHERE ticker = ?),
+                            (SELECT source_id FROM sources WHERE title = ?),
+                            (?),
+                            (SELECT time_span_id FROM timespans WHERE title = ? COLLATE NOCASE),
+                            (SELECT sec_type_id FROM sectypes WHERE title = ? COLLATE NOCASE),
+                            (SELECT currency_id FROM currency WHERE title = ? COLLATE NOCASE),
+                            (?),
+                            (?),
+                            (?),
+                            (?),
+                            (?),
+                            (?)
                         );"""
 
+        return insert_quote
+
+    def _get_base_quote_values(self, quote):
+        """
+            Get the values for the parametrized query to add base quote data.
+
+            Args:
+                quote(dict): quote obtained from an API wrapper.
+
+            Returns:
+                tuple: values for the query.
+        """
+        values = (self.symbol,
+                  self.source_title,
+                  quote['ts'],
+                  self.timespan,
+                  quote['sectype'],
+                  quote['currency'],
+                  quote['open'],
+                  quote['high'],
+                  quote['low'],
+                  quote['adj_close'],
+                  quote['volume'],
+                  quote['transactions'])
+
+        return tuple(get_sql_value(value) for value in values)
+
+    def _add_base_quote_data(self, quote):
+        """
+            Add base quote data (similar for all security types) to the database but do not perform commit.
+
+            Args:
+                quotes_dict(list of dictionaries): quotes obtained from an API wrapper.
+
+            Returns:
+                int: last row id of the operation.
+
+            Raises:
+                FdataError: sql error happened.
+        """
+        self.check_if_connected()
+
+        insert_quote = self._get_base_quote_query()
+        values = self._get_base_quote_values(quote)
+
         try:
-            self.cur.execute(insert_quote)
+            self.cur.execute(insert_quote, values)
         except self.Error as e:
-            raise FdataError(f"Can't add quotes data to a table 'quotes': {e}\n\nThe query is\n{insert_quote}") from e
+            raise FdataError(f"Can't add quotes data to a table 'quotes': {e}\n\nThe query is\n{insert_quote}\n\nThe values are\n{values}") from e
 
         return self.cur.lastrowid
 
+    def _add_base_quotes(self, quotes_dict):
+        """
+            Add base quote data (similar for all security types) of all the quotes at once but do not perform commit.
+
+            Args:
+                quotes_dict(list of dictionaries): quotes obtained from an API wrapper.
+
+            Raises:
+                FdataError: sql error happened.
+        """
+        self.check_if_connected()
+
+        insert_quote = self._get_base_quote_query()
+
+        try:
+            self.cur.executemany(insert_quote, (self._get_base_quote_values(quote) for quote in quotes_dict))
+        except self.Error as e:
+            raise FdataError(f"Can't add quotes data to a table 'quotes': {e}\n\nThe query is\n{insert_quote}") from e
+
     def add_quotes(self, quotes_dict):
         """
             Add quotes to the database.
@@ -1030,8 +1103,7 @@ class ReadWriteData(ReadOnlyData):
 
         num_before = self.get_quotes_num()
 
-        for quote in quotes_dict:
-            self._add_base_quote_data(quote)
+        self._add_base_quotes(quotes_dict)
 
         self.commit()
 
@@ -1078,6 +1150,9 @@ class BaseFetcher(ReadWriteData, metaclass=abc.ABCMeta):
             The data will be cached in the database. This method will connect to the database automatically if needed.
             At the end the connection status will be resumed.
 
+            The database acts as a persistent cache keyed by symbol, dates and timespan: if the threshold is met,
+            the data source is not queried at all and the quotes are read from the database only.
+
             Args:
                 treshold(int): the minimum required number of quotes in the database.
                 pause(int): pause in seconds before fetching data (needed to avoid failure because of api keys limits).
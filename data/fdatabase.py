@@ -66,11 +66,18 @@ class SQLiteConn(DBConn):
         self.source.cur = self.source.conn.cursor()
         self.source.Error = Error
 
-        # Enable foreign keys
+        # Enable foreign keys. Use WAL journal and memory mapping as quotes are written in bulk and read heavily.
+        pragmas = "PRAGMA journal_mode=WAL;" \
+                  "PRAGMA synchronous=NORMAL;" \
+                  "PRAGMA temp_store=MEMORY;" \
+                  "PRAGMA mmap_size=268435456;" \
+                  "PRAGMA cache_size=-65536;" \
+                  "PRAGMA foreign_keys=on;"
+
         try:
-            self.source.cur.execute("PRAGMA foreign_keys=on;")
+            self.source.cur.executescript(pragmas)
         except self.source.Error as e:
-            raise FdatabaseError(f"Can't enable foreign keys: {e}") from e
+            raise FdatabaseError(f"Can't set database pragmas (including foreign keys): {e}") from e
 
     # Close the connection
     def db_close(self):
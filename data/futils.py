@@ -7,11 +7,10 @@ Distributed under Fcore License 1.1 (see license.md)
 from datetime import datetime, timedelta
 import pytz
 
-import plotly.graph_objects as go
-
 import os
 from os.path import exists
 import glob
+import re
 
 from data import fvalues
 
@@ -80,58 +79,63 @@ def get_ts_from_str(value):
     """
     return int(get_dt(value).timestamp())
 
-def write_image(img):
+def write_image(img, file_format='png'):
     """
         Write plotly figure to a disk.
 
         Args:
             img(PIL.Image or go.Figure): Image to write.
+            file_format(str): 'png' to render the image, 'json' or 'html' to write the figure without rendering (go.Figure only).
+                JSON is serialized using orjson if it is installed.
 
         Returns:
             str: new file name.
 
         Raises:
-            RuntimeError: can't generate a filename.
+            RuntimeError: can't generate a filename or the format is not supported.
     """
-    new_file = gen_image_path()
-
     if type(img).__name__ == "Figure":
-        img.write_image(new_file)
+        if file_format not in ('png', 'json', 'html'):
+            raise RuntimeError(f"Unsupported file format for a figure: {file_format}")
+
+        new_file = gen_image_path(file_format)
+
+        if file_format == 'json':
+            img.write_json(new_file)
+        elif file_format == 'html':
+            img.write_html(new_file, include_plotlyjs='cdn')
+        else:
+            img.write_image(new_file)
     elif type(img).__name__ == "Image":
+        if file_format != 'png':
+            raise RuntimeError(f"Unsupported file format for an image: {file_format}")
+
+        new_file = gen_image_path(file_format)
         img.save(new_file)
     else:
         raise RuntimeError(f"Unsupported image type: {type(img).__name__}")
 
     return new_file
 
-def gen_image_path():
+def gen_image_path(file_format='png'):
     """
-        Generate a next sequential filename for an image.
+        Generate a next sequential filename for an image. The counter is shared by all the file formats.
+
+        Args:
+            file_format(str): extension of the file.
 
         Returns:
             str: new image path.
     """
     img_dir = "images"
 
-    if exists(img_dir) == False:
-        os.mkdir(img_dir)
+    os.makedirs(img_dir, exist_ok=True)
 
-    files = glob.glob(os.path.join(img_dir, "fig_*.png"))
+    # Only the maximum counter is needed, so there is no need to sort the file names
+    pattern = re.compile(r'fig_(\d+)\.(png|json|html)$')
+    last_file = max((int(m.group(1)) for entry in os.scandir(img_dir) if (m := pattern.match(entry.name))), default=0)
 
-    files.sort(key=lambda x: int(x.partition('_')[2].partition('.')[0]))
-
-    if len(files) == 0:
-        last_file = 0
-    else:
-        last_file = files[-1]
-        last_file = last_file.replace('.png', '').replace(os.path.join(img_dir, 'fig_'), '')
-    
-    try:
-        new_counter = int(last_file) + 1
-    except ValueError as e:
-        raise RuntimeError(f"Can't generate new filename. {last_file} has a broken filename pattern.") from e
-
-    new_file = os.path.join(img_dir, "fig_") + f"{new_counter}" + ".png"
+    new_file = os.path.join(img_dir, "fig_") + f"{last_file + 1}" + f".{file_format}"
 
     return new_file
 
@@ -212,6 +216,8 @@ def build_chart(rows):
         Returns:
             str: new file name.
     """
+    import plotly.graph_objects as go
+
     date = [row[fvalues.Quotes.DateTime] for row in rows]
     close = [row[fvalues.Quotes.AdjClose] for row in rows]
 
@@ -4,7 +4,7 @@ The author is Zmicier Gotowka
 
 Distributed under Fcore License 1.1 (see license.md)
 """
-from data.fdata import FdataError, ReadOnlyData, ReadWriteData, BaseFetcher
+from data.fdata import FdataError, ReadOnlyData, ReadWriteData, BaseFetcher, get_sql_value
 from data.fvalues import SecType, ReportPeriod, five_hundred_days
 
 import abc
@@ -514,22 +514,30 @@ class RWStockData(ROStockData, ReadWriteData):
 
         num_before = self.get_quotes_num()
 
-        for quote in quotes_dict:
-            quote_id = self._add_base_quote_data(quote)
+        self._add_base_quotes(quotes_dict)
+
+        # Row ids of the inserted quotes are not known after executemany(), so quote_id is looked up by the unique key
+        insert_core = f"""INSERT OR {self._update} INTO stock_core (quote_id, raw_close, dividends, split_coefficient)
+                        VALUES (
+                            (SELECT quote_id FROM quotes WHERE symbol_id = (SELECT symbol_id FROM symbols WHERE ticker = ?)
+                                AND time_span_id = (SELECT time_span_id FROM timespans WHERE title = ? COLLATE NOCASE)
+                                AND time_stamp = ?),
+                            (?),
+                            (?),
+                            (?)
+                        );"""
+
+        values = ((self.symbol,
+                   self.timespan,
+                   quote['ts'],
+                   get_sql_value(quote['raw_close']),
+                   get_sql_value(quote['divs']),
+                   get_sql_value(quote['split'])) for quote in quotes_dict)
 
-            if quote_id != 0:
-                insert_core = f"""INSERT OR {self._update} INTO stock_core (quote_id, raw_close, dividends, split_coefficient)
-                                VALUES (
-                                    ({quote_id}),
-                                    ({quote['raw_close']}),
-                                    ({quote['divs']}),
-                                    ({quote['split']})
-                                );"""
-
-                try:
-                    self.cur.execute(insert_core)
-                except self.Error as e:
-                    raise FdataError(f"Can't add data to a table 'stock_core': {e}\n\nThe query is\n{insert_core}") from e
+        try:
+            self.cur.executemany(insert_core, values)
+        except self.Error as e:
+            raise FdataError(f"Can't add data to a table 'stock_core': {e}\n\nThe query is\n{insert_core}") from e
 
         self.commit()
 
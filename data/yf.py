@@ -8,6 +8,7 @@ from datetime import datetime
 import pytz
 
 import pandas as pd
+import numpy as np
 
 import yfinance as yfin
 
@@ -69,15 +70,12 @@ class YF(stock.StockFetcher):
         else:
             raise FdataError(f"Requested timespan is not supported by Polygon: {self.timespan}")
 
-    def fetch_quotes(self):
+    def get_period_args(self):
         """
-            The method to fetch quotes.
+            Get the arguments to specify the requested period in YF queries.
 
             Returns:
-                list: quotes data
-
-            Raises:
-                FdataError: network error, no data obtained, can't parse json or the date is incorrect.
+                dict: start and end dates or the maximum period if dates are not specified.
         """
         if self.first_date_ts != def_first_date or self.last_date_ts != def_last_date:
             last_date = self.last_date
@@ -88,52 +86,153 @@ class YF(stock.StockFetcher):
             else:
                 last_date_str = self.last_date_str
 
-            data = yfin.Ticker(self.symbol).history(interval=self.get_timespan(),
-                                                        start=self.first_date_str,
-                                                        end=last_date_str)
-        else:
-            data = yfin.Ticker(self.symbol).history(interval=self.get_timespan(), period='max')
+            return {'start': self.first_date_str, 'end': last_date_str}
+
+        return {'period': 'max'}
+
+    def get_columns(self, data, symbol):
+        """
+            Convert quotes obtained from YF to columns.
+
+            Args:
+                data(pd.DataFrame): quotes data obtained from YF.
+                symbol(str): symbol of the quotes.
+
+            Returns:
+                dict: quotes data where each key (the same as in a quote returned by fetch_quotes()) corresponds to a numpy array.
 
+            Raises:
+                FdataError: no data obtained.
+        """
         length = len(data)
 
         if length == 0:
-            raise FdataError(f"Can not fetch quotes for {self.symbol}. No quotes fetched.")
+            raise FdataError(f"Can not fetch quotes for {symbol}. No quotes fetched.")
 
-        # Create a list of dictionaries with quotes
-        quotes_data = []
+        # Missing volume can't be converted to an integer
+        data = data.fillna({'Volume': 0, 'Dividends': 0, 'Stock Splits': 0})
 
-        for ind in range(length):
-            dt = data.index[ind]
-            dt = dt.replace(tzinfo=pytz.utc)
+        # Get datetimes in UTC keeping the wall time (the same as replacing tzinfo)
+        dts = data.index
 
-            if self.timespan in [Timespans.Day, Timespans.Week, Timespans.Month]:
-                # Add 23:59:59 to non-intraday quotes
-                dt = dt.replace(hour=23, minute=59, second=59)
+        if dts.tz is not None:
+            dts = dts.tz_localize(None)
 
-                # Stock split coefficient 0 (reported by default) should be set to 1 as it makes more sense
-                stock_splits = data['Stock Splits'][ind]
-                if stock_splits == 0:
-                    stock_splits = 1
-            else:
-                # Stock splits has no sense intraday
-                stock_splits = 1
-
-            quote_dict = {
-                'volume': data['Volume'][ind],
-                'open': data['Open'][ind],
-                'adj_close': data['Close'][ind],
-                'high': data['High'][ind],
-                'low': data['Low'][ind],
-                'raw_close': 'NULL',
-                'transactions': 'NULL',
-                'divs': data['Dividends'][ind],
-                'split': stock_splits,
-                'ts': int(datetime.timestamp(dt)),
-                'sectype': self.sectype.value,
-                'currency': self.currency.value
-            }
-
-            quotes_data.append(quote_dict)
+        if self.timespan in [Timespans.Day, Timespans.Week, Timespans.Month]:
+            # Add 23:59:59 to non-intraday quotes
+            dts = dts.normalize() + pd.Timedelta(hours=23, minutes=59, seconds=59)
+
+            # Stock split coefficient 0 (reported by default) should be set to 1 as it makes more sense
+            # Splits may be fractional (like 3:2)
+            stock_splits = data['Stock Splits'].to_numpy(dtype=np.float64)
+            stock_splits = np.where(stock_splits == 0, 1, stock_splits)
+        else:
+            # Stock splits has no sense intraday
+            stock_splits = np.ones(length, dtype=np.float64)
+
+        # Floor division keeps timestamps correct for quotes before 1970
+        timestamps = dts.to_numpy(dtype='datetime64[ns]').view('int64') // 10**9
+
+        columns = {
+                      'volume': data['Volume'].to_numpy(dtype=np.int64),
+                      'open': data['Open'].to_numpy(dtype=np.float64),
+                      'adj_close': data['Close'].to_numpy(dtype=np.float64),
+                      'high': data['High'].to_numpy(dtype=np.float64),
+                      'low': data['Low'].to_numpy(dtype=np.float64),
+                      'divs': data['Dividends'].to_numpy(dtype=np.float64),
+                      'split': stock_splits,
+                      'ts': timestamps
+                  }
+
+        return columns
+
+    def fetch_columns(self):
+        """
+            The method to fetch quotes as columns.
+
+            Returns:
+                dict: quotes data where each key (the same as in a quote returned by fetch_quotes()) corresponds to a numpy array.
+
+            Raises:
+                FdataError: network error, no data obtained, can't parse json or the date is incorrect.
+        """
+        data = yfin.Ticker(self.symbol).history(interval=self.get_timespan(), **self.get_period_args())
+
+        return self.get_columns(data, self.symbol)
+
+    def fetch_many(self, symbols):
+        """
+            Fetch quotes for several symbols in one request. Dates and timespan of the current instance are used for all the symbols.
+
+            Args:
+                symbols(list): symbols to fetch.
+
+            Returns:
+                dict: quotes data as columns (see fetch_columns()) for each symbol. The types of the columns are the same
+                    as returned by fetch_columns() even if YF filled the missing quotes with NaN.
+
+            Raises:
+                FdataError: network error or no data obtained for a symbol.
+        """
+        data = yfin.download(tickers=' '.join(symbols),
+                             interval=self.get_timespan(),
+                             group_by='ticker',
+                             auto_adjust=True,
+                             actions=True,
+                             threads=True,
+                             progress=False,
+                             **self.get_period_args())
+
+        results = {}
+
+        for symbol in symbols:
+            try:
+                symbol_data = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+            except KeyError as e:
+                raise FdataError(f"Can not fetch quotes for {symbol}. No quotes fetched.") from e
+
+            # Dates are aligned for all the symbols, skip the dates when the symbol was not traded
+            symbol_data = symbol_data.dropna(subset=['Close'])
+
+            results[symbol] = self.get_columns(symbol_data, symbol)
+
+        return results
+
+    def fetch_quotes(self):
+        """
+            The method to fetch quotes.
+
+            Returns:
+                list: quotes data
+
+            Raises:
+                FdataError: network error, no data obtained, can't parse json or the date is incorrect.
+        """
+        columns = self.fetch_columns()
+        length = len(columns['ts'])
+
+        # Create a list of dictionaries with quotes
+        quotes_data = [{
+                           'volume': volume,
+                           'open': open_,
+                           'adj_close': close,
+                           'high': high,
+                           'low': low,
+                           'raw_close': 'NULL',
+                           'transactions': 'NULL',
+                           'divs': divs,
+                           'split': split,
+                           'ts': ts,
+                           'sectype': self.sectype.value,
+                           'currency': self.currency.value
+                       } for volume, open_, close, high, low, divs, split, ts in zip(columns['volume'].tolist(),
+                                                                                     columns['open'].tolist(),
+                                                                                     columns['adj_close'].tolist(),
+                                                                                     columns['high'].tolist(),
+                                                                                     columns['low'].tolist(),
+                                                                                     columns['divs'].tolist(),
+                                                                                     columns['split'].tolist(),
+                                                                                     columns['ts'].tolist())]
 
         if len(quotes_data) != length:
             raise FdataError(f"Obtained and parsed data length does not match: {length} != {len(quotes_data)}.")
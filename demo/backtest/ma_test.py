@@ -14,7 +14,7 @@ from backtest.reporting import Report
 from data.fdata import FdataError
 from data.yf import YF
 
-import plotly.graph_objects as go
+from concurrent.futures import ProcessPoolExecutor
 
 import sys
 
@@ -24,10 +24,30 @@ threshold = 1385  # Quotes num threshold for the test
 min_width = 2500 # Minimum width for charting
 height = 250  # Height of each subchart in reporting
 
+def calculate(strategy, rows, data_args, strategy_args):
+    """
+        Perform the strategy calculation. It is used to calculate the strategies in separate processes.
+
+        Args:
+            strategy(class): backtesting strategy class.
+            rows(list): quotes data.
+            data_args(dict): arguments for StockData.
+            strategy_args(dict): arguments for the strategy.
+
+        Returns:
+            BTData: results of the calculation.
+    """
+    quotes = StockData(rows=rows, **data_args)
+    bt = strategy(data=[quotes], **strategy_args)
+    bt.calculate()
+
+    return bt.get_results()
+
 if __name__ == "__main__":
     # Get quotes
     try:
         # Fetch quotes if there are less than a threshold number of records in the database for the specified timespan.
+        # Otherwise the quotes cached in the database are used and yfinance is not queried.
         source = YF(symbol="SPY", first_date="2017-01-30", last_date="2022-8-1")
         rows, num = source.fetch_if_none(threshold)
     except FdataError as e:
@@ -40,55 +60,50 @@ if __name__ == "__main__":
     else:
         print(f"No need to fetch quotes for {source.symbol}. There are {length} quotes in the database and it is >= the threshold level of {threshold}.")
 
-    quotes = StockData(rows=rows,
-                          title=source.symbol,
-                          margin_rec=0.4,
-                          margin_req=0.7,
-                          spread=0.1,
-                          margin_fee=1,
-                          trend_change_period=2,
-                          trend_change_percent=2
-                         )
-
-    ma = MA(
-        data=[quotes],
-        commission=2.5,
-        initial_deposit=10000,
-        periodic_deposit=500,
-        deposit_interval=30,
-        inflation=2.5,
-        period=period,
-        margin_rec=0.9,
-        margin_req=1,
-        verbose=False,
-    )
+    # sqlite3.Row can't be passed to other processes
+    rows = [tuple(row) for row in rows]
+
+    ma_data_args = dict(title=source.symbol,
+                        margin_rec=0.4,
+                        margin_req=0.7,
+                        spread=0.1,
+                        margin_fee=1,
+                        trend_change_period=2,
+                        trend_change_percent=2)
+
+    ma_args = dict(commission=2.5,
+                   initial_deposit=10000,
+                   periodic_deposit=500,
+                   deposit_interval=30,
+                   inflation=2.5,
+                   period=period,
+                   margin_rec=0.9,
+                   margin_req=1,
+                   verbose=False)
 
     # Buy and Hold to compare
 
-    quotes_bh = StockData(rows=rows,
-                             title=source.symbol,
-                             spread=0.1,
-                            )
-
-    bh = BuyAndHold(
-        data=[quotes_bh],
-        commission=2.5,
-        initial_deposit=10000,
-        periodic_deposit=500,
-        deposit_interval=30,
-        inflation=2.5,
-        offset=period
-    )
+    bh_data_args = dict(title=source.symbol,
+                        spread=0.1)
+
+    bh_args = dict(commission=2.5,
+                   initial_deposit=10000,
+                   periodic_deposit=500,
+                   deposit_interval=30,
+                   inflation=2.5,
+                   offset=period)
+
+    # The strategies are independent, so they are calculated in separate processes
+    pool = ProcessPoolExecutor(max_workers=2)
+
+    future_ma = pool.submit(calculate, MA, rows, ma_data_args, ma_args)
+    future_bh = pool.submit(calculate, BuyAndHold, rows, bh_data_args, bh_args)
 
     try:
-        ma.calculate()
-        bh.calculate()
+        results = future_ma.result()
     except BackTestError as e:
         sys.exit(f"Can't perform backtesting calculation: {e}")
 
-    results_bh = bh.get_results()
-    results = ma.get_results()
-
     #################
     # Create a report
     #################
@@ -98,14 +113,25 @@ if __name__ == "__main__":
     # Add a chart with quotes
     fig_quotes = report.add_quotes_chart(title=f"MA/Quote Cross Backtesting Example for {source.symbol}")
 
+    # Both strategies share the same datetime axis which is reused by the additional traces
+    dts = results.DateTime
+
     # Append MA values to the quotes chart
-    fig_quotes.add_trace(go.Scatter(x=results.DateTime, y=results.Symbols[0].Tech[0], mode='lines', name="MA", line=dict(color="green")))
+    fig_quotes.add_trace(report.get_line_trace(dts, results.Symbols[0].Tech[0], "MA", line=dict(color="green")))
+
+    # B&H results are needed only for the portfolio chart so the charts above are built while B&H may still be calculated
+    try:
+        results_bh = future_bh.result()
+    except BackTestError as e:
+        sys.exit(f"Can't perform backtesting calculation: {e}")
+
+    pool.shutdown()
 
     # Add a chart to represent portfolio performance
     fig_portf = report.add_portfolio_chart(height=height)
 
     # Append B&H comparison to the portfolio chart
-    fig_portf.add_trace(go.Scatter(x=results.DateTime, y=results_bh.TotalValue, mode='lines', name="Total Value Buy and Hold", line=dict(color="#32CD32")))
+    fig_portf.add_trace(report.get_line_trace(dts, results_bh.TotalValue, "Total Value Buy and Hold", line=dict(color="#32CD32")))
 
     # Add chart a with expenses
     report.add_expenses_chart(height=height)
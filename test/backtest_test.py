@@ -0,0 +1,105 @@
+import unittest
+
+import sys
+sys.path.append('../')
+
+from backtest.base import BTData, BTDataEnum
+from backtest.stock import StockData
+
+from data.fvalues import Quotes
+
+import numpy as np
+import pickle
+
+class Test(unittest.TestCase):
+    def get_rows(self, num):
+        return [{Quotes.DateTime: f"2022-01-{i + 1:02d} 23:59:59",
+                 Quotes.Open: i + 0.5,
+                 Quotes.High: i + 2.0,
+                 Quotes.Low: i + 0.0,
+                 Quotes.AdjClose: i + 1.0} for i in range(num)]
+
+    def test_0_check_columns(self):
+        rows = self.get_rows(10)
+        data = StockData(rows=rows)
+
+        columns = data.get_columns()
+
+        # Rows are parsed only once
+        assert data.get_columns() is columns
+        assert len(columns[Quotes.DateTime]) == 10
+        assert columns[Quotes.AdjClose][0] == rows[0][Quotes.AdjClose]
+
+        # Trim the rows in place the same way as BackTest.setup() does
+        rows[:] = rows[1:]
+        data.reset_columns()
+
+        columns = data.get_columns()
+
+        assert len(columns[Quotes.DateTime]) == 9
+        assert columns[Quotes.AdjClose][0] == data.get_rows()[0][Quotes.AdjClose]
+
+    def get_result(self, num):
+        return [f"2022-01-{num + 1:02d} 23:59:59"] + [float(num)] * (len(BTDataEnum) - 1)
+
+    def test_1_check_bt_data(self):
+        data = BTData()
+
+        assert data.Data is None
+
+        data.append(self.get_result(0))
+        data.append(self.get_result(1))
+
+        assert data.Data.shape == (2, len(BTDataEnum))
+        np.testing.assert_array_equal(data.TotalValue, np.array([0, 1]))
+
+        # Columns are cached and read-only
+        assert data.TotalValue is data.TotalValue
+        assert data.TotalValue.flags['C_CONTIGUOUS']
+        self.assertRaises(ValueError, data.TotalValue.__setitem__, 0, 5)
+
+        # Changing the data invalidates the cached columns
+        data[0, BTDataEnum.TotalValue] = 5
+
+        assert data[0, BTDataEnum.TotalValue] == 5
+        np.testing.assert_array_equal(data.TotalValue, np.array([5, 1]))
+
+        # The changed value persists if more rows are appended
+        data.append(self.get_result(2))
+
+        assert data.Data.shape == (3, len(BTDataEnum))
+        np.testing.assert_array_equal(data.TotalValue, np.array([5, 1, 2]))
+
+        data.TotalTrades = (2, 7)
+
+        np.testing.assert_array_equal(data.TotalTrades, np.array([0, 1, 7]))
+        self.assertRaises(ValueError, setattr, data, 'TotalTrades', (1, 2, 3))
+
+    def test_2_check_bt_data_pickle(self):
+        data = BTData()
+
+        data.append(self.get_result(0))
+        data.append(self.get_result(1))
+        data.Data
+
+        data = pickle.loads(pickle.dumps(data))
+
+        data[0, BTDataEnum.TotalValue] = 123
+        data.append(self.get_result(2))
+
+        np.testing.assert_array_equal(data.TotalValue, np.array([123, 1, 2]))
+
+    def test_3_check_bt_data_setter(self):
+        data = BTData()
+
+        data.append(self.get_result(0))
+        np.testing.assert_array_equal(data.TotalValue, np.array([0]))
+
+        data.Data = np.array([self.get_result(3), self.get_result(4)], dtype='object')
+
+        np.testing.assert_array_equal(data.TotalValue, np.array([3, 4]))
+        np.testing.assert_array_equal(data.DateTime, np.array(["2022-01-04 23:59:59", "2022-01-05 23:59:59"]))
+
+        data.append(self.get_result(5))
+
+        np.testing.assert_array_equal(data.TotalValue, np.array([3, 4, 5]))
@@ -1,6 +1,6 @@
 import unittest
 
-from mockito import when, mock, verify, unstub
+from mockito import when, mock, verify, unstub, ANY
 
 import sys
 sys.path.append('../')
@@ -474,15 +474,16 @@ class FdataTest(unittest.TestCase, DataMocker):
         verify(self.read_data.cur, times=1).fetchone()
 
     def test_14_get_symbol_quotes_num_dt(self):
-        sql_query = f"""SELECT COUNT(*) FROM quotes WHERE symbol_id =
-                        (SELECT symbol_id FROM symbols where ticker = '{self.read_data.symbol}') AND
-                        time_stamp >= {self.read_data.first_date_ts} AND time_stamp <= {self.read_data.last_date_ts};"""
+        sql_query = """SELECT COUNT(*) FROM quotes WHERE symbol_id =
+                        (SELECT symbol_id FROM symbols where ticker = (?)) AND
+                        time_stamp >= (?) AND time_stamp <= (?);"""
+        values = (self.read_data.symbol, self.read_data.first_date_ts, self.read_data.last_date_ts)
 
-        when(self.read_data.cur).execute(sql_query).thenReturn()
+        when(self.read_data.cur).execute(sql_query, values).thenReturn()
 
         assert self.read_data.get_symbol_quotes_num_dt() == 'r'
 
-        verify(self.read_data.cur, times=1).execute(sql_query)
+        verify(self.read_data.cur, times=1).execute(sql_query, values)
         verify(self.read_data.cur, times=1).fetchone()
 
     def test_15_get_max_datetime(self):
@@ -539,7 +540,7 @@ class FdataTest(unittest.TestCase, DataMocker):
             'high': 4,
             'low': 5,
             'raw_close': 6,
-            'transactions': 7,
+            'transactions': 'NULL',
             'ts': 8,
             'sectype': self.write_data.sectype.value,
             'currency': self.write_data.currency.value
@@ -558,21 +559,34 @@ class FdataTest(unittest.TestCase, DataMocker):
                                                                     volume,
                                                                     transactions)
                             VALUES (
-                            (SELECT symbol_id FROM symbols WHERE ticker = '{self.write_data.symbol}'),
-                            (SELECT source_id FROM sources WHERE title = '{self.write_data.source_title}'),
-                            ({quote_dict['ts']}),
-                            (SELECT time_span_id FROM timespans WHERE title = '{self.write_data.timespan}' COLLATE NOCASE),
-                            (SELECT sec_type_id FROM sectypes WHERE title = '{quote_dict['sectype']}' COLLATE NOCASE),
-                            (SELECT currency_id FROM currency WHERE title = '{quote_dict['currency']}' COLLATE NOCASE),
-                            ({quote_dict['open']}),
-                            ({quote_dict['high']}),
-                            ({quote_dict['low']}),
-                            ({quote_dict['adj_close']}),
-                            ({quote_dict['volume']}),
-                            ({quote_dict['transactions']})
+                            (SELECT symbol_id FROM symbols WHERE ticker = ?),
+                            (SELECT source_id FROM sources WHERE title = ?),
+                            (?),
+                            (SELECT time_span_id FROM timespans WHERE title = ? COLLATE NOCASE),
+                            (SELECT sec_type_id FROM sectypes WHERE title = ? COLLATE NOCASE),
+                            (SELECT currency_id FROM currency WHERE title = ? COLLATE NOCASE),
+                            (?),
+                            (?),
+                            (?),
+                            (?),
+                            (?),
+                            (?)
                         );"""
 
-        when(self.write_data.cur).execute(sql_query).thenReturn()
+        values = (self.write_data.symbol,
+                  self.write_data.source_title,
+                  quote_dict['ts'],
+                  self.write_data.timespan,
+                  quote_dict['sectype'],
+                  quote_dict['currency'],
+                  quote_dict['open'],
+                  quote_dict['high'],
+                  quote_dict['low'],
+                  quote_dict['adj_close'],
+                  quote_dict['volume'],
+                  None)
+
+        when(self.write_data.cur).execute(sql_query, values).thenReturn()
 
         self.write_data.cur.lastrowid = 10
 
@@ -580,7 +594,7 @@ class FdataTest(unittest.TestCase, DataMocker):
 
         assert lastrowid == self.write_data.cur.lastrowid
 
-        verify(self.write_data.cur, times=1).execute(sql_query)
+        verify(self.write_data.cur, times=1).execute(sql_query, values)
 
     def test_21_check_add_quotes(self):
         quote_dict = {
@@ -597,18 +611,22 @@ class FdataTest(unittest.TestCase, DataMocker):
 
         quotes = [quote_dict]
 
+        executed = []
+
         when(self.write_data).get_symbol_quotes_num().thenReturn(1)
         when(self.write_data).get_quotes_num().thenReturn(1)
-        when(self.write_data)._add_base_quote_data(quote_dict).thenReturn(1)
+        when(self.write_data.cur).executemany(self.write_data._get_base_quote_query(), ANY).thenAnswer(lambda query, values: executed.extend(values))
         when(self.write_data).commit().thenReturn()
 
         before, after = self.write_data.add_quotes(quotes)
 
         verify(self.write_data, times=1).get_symbol_quotes_num()
         verify(self.write_data, times=2).get_quotes_num()
-        verify(self.write_data, times=1)._add_base_quote_data(quote_dict)
+        verify(self.write_data.cur, times=1).executemany(self.write_data._get_base_quote_query(), ANY)
         verify(self.write_data, times=1).commit()
 
+        assert executed == [self.write_data._get_base_quote_values(quote_dict)]
+
         assert before == 1
         assert after == 1
 
@@ -24,11 +24,16 @@ class Test(unittest.TestCase):
         when(sqlite3).connect(self.source.db_name).thenReturn(self.source.conn)
         when(self.source.conn).cursor().thenReturn(self.source.cur)
 
-        sql_query = "PRAGMA foreign_keys=on;"
-        when(self.source.cur).execute(sql_query).thenReturn()
+        sql_query = "PRAGMA journal_mode=WAL;" \
+                    "PRAGMA synchronous=NORMAL;" \
+                    "PRAGMA temp_store=MEMORY;" \
+                    "PRAGMA mmap_size=268435456;" \
+                    "PRAGMA cache_size=-65536;" \
+                    "PRAGMA foreign_keys=on;"
+        when(self.source.cur).executescript(sql_query).thenReturn()
 
         self.db.db_connect()
 
         verify(sqlite3, times=1).connect(self.source.db_name)
         verify(self.source.conn, times=1).cursor()
-        verify(self.source.cur, times=1).execute(sql_query)
+        verify(self.source.cur, times=1).executescript(sql_query)
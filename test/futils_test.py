@@ -142,7 +142,10 @@ class Test(unittest.TestCase):
 
         self.assertRaises(RuntimeError, futils.write_image, img3)
 
-        when(futils).gen_image_path().thenReturn(image_path)
+        self.assertRaises(RuntimeError, futils.write_image, img1, 'svg')
+        self.assertRaises(RuntimeError, futils.write_image, img2, 'html')
+
+        when(futils).gen_image_path('png').thenReturn(image_path)
 
         when(img1).write_image(image_path).thenReturn()
         when(img2).save(image_path).thenReturn()
@@ -159,21 +162,38 @@ class Test(unittest.TestCase):
 
         assert image_path == result2
 
+        json_path = "/home/user/Pictures/1.json"
+        html_path = "/home/user/Pictures/1.html"
+
+        when(futils).gen_image_path('json').thenReturn(json_path)
+        when(futils).gen_image_path('html').thenReturn(html_path)
+
+        when(img1).write_json(json_path).thenReturn()
+        when(img1).write_html(html_path, include_plotlyjs='cdn').thenReturn()
+
+        assert futils.write_image(img1, 'json') == json_path
+        assert futils.write_image(img1, 'html') == html_path
+
+        verify(img1, times=1).write_json(json_path)
+        verify(img1, times=1).write_html(html_path, include_plotlyjs='cdn')
+
     def test_4_gen_image_path(self):
         img_dir = "images"
-        file_mask = "fig_*.png"
-        expected_file = os.path.join(img_dir, "fig_1.png")
-        files = []
+        expected_file1 = os.path.join(img_dir, "fig_1.png")
+        expected_file2 = os.path.join(img_dir, "fig_11.png")
+        files = [mock({'name': 'fig_2.png'}), mock({'name': 'fig_10.png'}), mock({'name': 'fig_x.png'}), mock({'name': 'other.png'}), mock({'name': 'fig_5.html'})]
 
-        when(futils).exists(img_dir).thenReturn(True)
-        when(glob).glob(os.path.join(img_dir, file_mask)).thenReturn(files)
+        when(os).makedirs(img_dir, exist_ok=True).thenReturn()
+        when(os).scandir(img_dir).thenReturn([]).thenReturn(files)
 
-        new_file = futils.gen_image_path()
+        new_file1 = futils.gen_image_path()
+        new_file2 = futils.gen_image_path()
 
-        verify(futils, times=1).exists(img_dir)
-        verify(glob, times=1).glob(os.path.join(img_dir, file_mask))
+        verify(os, times=2).makedirs(img_dir, exist_ok=True)
+        verify(os, times=2).scandir(img_dir)
 
-        assert new_file == expected_file
+        assert new_file1 == expected_file1
+        assert new_file2 == expected_file2
 
     def test_11_open_image(self):
         image_path = "/home/user/Pictures/1.png"
@@ -267,7 +287,7 @@ class Test(unittest.TestCase):
 
         fig = go.Figure(fig_arg)
 
-        when(futils.go).Figure(fig_arg).thenReturn(fig)
+        when(go).Figure(fig_arg).thenReturn(fig)
         when(fig).update_layout(**update_args).thenReturn()
         when(futils).write_image(fig).thenReturn(expected_file)
 
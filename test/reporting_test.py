@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+
+import sys
+sys.path.append('../')
+
+from backtest.reporting import Report, ReportsError, render_kaleido
+
+import numpy as np
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        # 10 buckets
+        self.report = Report(data=None, width=10)
+
+    def test_0_check_downsample_short(self):
+        x = np.arange(20)
+        y = np.arange(20, dtype='float')
+
+        new_x, new_y = self.report.downsample(x, y)
+
+        np.testing.assert_array_equal(new_x, x)
+        np.testing.assert_array_equal(new_y, y)
+
+    def test_1_check_downsample_endpoints(self):
+        # A step-shaped series which is constant in the first and the last buckets
+        x = np.arange(95)
+        y = np.zeros(95)
+        y[40:] = 1
+
+        new_x, new_y = self.report.downsample(x, y)
+
+        assert new_x[0] == 0
+        assert new_x[-1] == 94
+        assert new_y[-1] == 1
+
+    def test_2_check_downsample_padding(self):
+        # The last bucket is padded by NaNs which should not be selected
+        x = np.arange(95)
+        y = np.arange(95, dtype='float')
+
+        new_x, new_y = self.report.downsample(x, y)
+
+        assert len(new_x) == len(new_y)
+        assert new_x.max() == 94
+        assert not np.isnan(new_y).any()
+
+    def test_3_check_downsample_nan(self):
+        x = np.arange(100)
+        y = np.arange(100, dtype='float')
+        y[20:30] = np.nan
+
+        new_x, new_y = self.report.downsample(x, y)
+
+        # A bucket of NaNs is represented by a single point to keep the gap in the line
+        assert len(new_x[(new_x >= 20) & (new_x < 30)]) == 1
+        assert np.isnan(new_y).sum() == 1
+
+        # Extremes of the neighbouring buckets are kept
+        assert {10, 19, 30, 39}.issubset(set(new_x))
+
+    def test_4_check_downsample_order(self):
+        rng = np.random.default_rng(0)
+
+        x = np.arange(1000)
+        y = rng.normal(size=1000)
+
+        new_x, new_y = self.report.downsample(x, y)
+
+        assert (np.diff(new_x) > 0).all()
+        np.testing.assert_array_equal(new_y, y[new_x])
+
+        # Global extremes are kept
+        assert y.argmin() in new_x
+        assert y.argmax() in new_x
+
+    def test_5_check_render_kaleido_missing(self):
+        with patch.dict(sys.modules, {'kaleido': None}):
+            self.assertRaises(ReportsError, render_kaleido, [{}])
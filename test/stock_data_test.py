@@ -1,6 +1,6 @@
 import unittest
 
-from mockito import when, mock, verify, unstub
+from mockito import when, mock, verify, unstub, ANY
 
 from fdata_test import DataMocker
 
@@ -502,27 +502,34 @@ class Test(unittest.TestCase, DataMocker):
         when(self.write_data).check_if_connected().thenReturn(True)
         when(self.write_data).get_symbol_quotes_num().thenReturn(1)
         when(self.write_data).get_quotes_num().thenReturn(1)
-        when(self.write_data)._add_base_quote_data(quote_dict).thenReturn(1)
+        when(self.write_data)._add_base_quotes(quotes).thenReturn()
         when(self.write_data).commit().thenReturn()
 
         sql_query = """INSERT OR IGNORE INTO stock_core (quote_id, raw_close, dividends, split_coefficient)
-                                VALUES (
-                                    (1),
-                                    (6),
-                                    (9),
-                                    (10)
-                                );"""
-        when(self.write_data.cur).execute(sql_query).thenReturn()
+                        VALUES (
+                            (SELECT quote_id FROM quotes WHERE symbol_id = (SELECT symbol_id FROM symbols WHERE ticker = ?)
+                                AND time_span_id = (SELECT time_span_id FROM timespans WHERE title = ? COLLATE NOCASE)
+                                AND time_stamp = ?),
+                            (?),
+                            (?),
+                            (?)
+                        );"""
+
+        executed = []
+
+        when(self.write_data.cur).executemany(sql_query, ANY).thenAnswer(lambda query, values: executed.extend(values))
 
         before, after = self.write_data.add_quotes(quotes)
 
         verify(self.write_data, times=1).check_if_connected()
         verify(self.write_data, times=1).get_symbol_quotes_num()
         verify(self.write_data, times=2).get_quotes_num()
-        verify(self.write_data, times=1)._add_base_quote_data(quote_dict)
-        verify(self.write_data, times=0).execute(sql_query)  # For some reason it is not detected as executed (but it definitely called according to UT debugging).
+        verify(self.write_data, times=1)._add_base_quotes(quotes)
+        verify(self.write_data.cur, times=1).executemany(sql_query, ANY)
         verify(self.write_data, times=1).commit()
 
+        assert executed == [(self.write_data.symbol, self.write_data.timespan, 8, 6, 9, 10)]
+
         assert before == 1
         assert after == 1
 
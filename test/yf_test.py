@@ -1,28 +1,19 @@
 import unittest
 
-import sys
-sys.path.append('../')
-
 import yfinance
 import pandas as pd
+import numpy as np
 
 from datetime import datetime, timedelta
 import pytz
 
-from mockito import when, verify, unstub
+from unittest.mock import patch, MagicMock
 
 from data.fvalues import Timespans
 from data import yf
 from data.fdata import FdataError
 
-class History():
-    def history(self, interval, start, end):
-        pass
-
 class Test(unittest.TestCase):
-    def tearDown(self):
-        unstub()
-
     def test_1_check_fetch_quotes(self):
         source = yf.YF()
         source.symbol = 'SPY'
@@ -36,7 +27,7 @@ class Test(unittest.TestCase):
         source.last_date = last_date
         source.timespan = timespan
 
-        hist = History()
+        hist = MagicMock()
 
         quote_dict1 = {
             'volume': 11,
@@ -82,17 +73,15 @@ class Test(unittest.TestCase):
         df = df.set_index('Date')
 
         # Mocking
-        when(yfinance).Ticker(source.symbol).thenReturn(hist)
-        when(hist).history(interval=source.get_timespan(), \
-                           start=source.first_date_str, \
-                           end=source.last_date_str).thenReturn(df)
+        hist.history.return_value = df
 
-        return_data = source.fetch_quotes()
+        with patch.object(yfinance, 'Ticker', return_value=hist) as m_ticker:
+            return_data = source.fetch_quotes()
 
-        verify(yfinance, times=1).Ticker(source.symbol)
-        verify(hist, times=1).history(interval=source.get_timespan(), \
-                                      start=source.first_date_str, \
-                                      end=source.last_date_str)
+        m_ticker.assert_called_once_with(source.symbol)
+        hist.history.assert_called_once_with(interval=source.get_timespan(), \
+                                             start=source.first_date_str, \
+                                             end=source.last_date_str)
 
         assert return_data == quotes_data
 
@@ -115,12 +104,161 @@ class Test(unittest.TestCase):
         df['Volume'] = [0, 0]
 
         # Mocking
-        when(yfinance).download(tickers=source.symbol, period='1d', interval='1m').thenReturn(df)
+        with patch.object(yfinance, 'download', return_value=df) as m_download:
+            return_data = source.get_recent_data()
 
-        return_data = source.get_recent_data()
-
-        verify(yfinance, times=1).download(tickers=source.symbol, period='1d', interval='1m')
+        m_download.assert_called_once_with(tickers=source.symbol, period='1d', interval='1m')
 
         expected_result = [1680105540, 2, 5, 6, 3, 4, 0, 'NULL', 'NULL', 'NULL']
 
         assert return_data == expected_result
+
+    def test_3_check_fetch_columns(self):
+        source = yf.YF()
+        source.symbol = 'SPY'
+
+        first_date = datetime(2022, 11, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+        last_date = datetime(2022, 12, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+
+        source.first_date = first_date
+        source.last_date = last_date
+        source.timespan = Timespans.Day
+
+        hist = MagicMock()
+
+        df = pd.DataFrame({'Date': [first_date, last_date],
+                           'Open': [1, 2],
+                           'Close': [3, 4],
+                           'High': [5, 6],
+                           'Low': [7, 8],
+                           'Dividends': [9, 10],
+                           'Volume': [11, 12],
+                           'Stock Splits': [0, 14]
+                         })
+        df = df.set_index('Date')
+
+        # Mocking
+        hist.history.return_value = df
+
+        with patch.object(yfinance, 'Ticker', return_value=hist) as m_ticker:
+            return_data = source.fetch_columns()
+
+        m_ticker.assert_called_once_with(source.symbol)
+
+        np.testing.assert_array_equal(return_data['volume'], np.array([11, 12]))
+        np.testing.assert_array_equal(return_data['open'], np.array([1, 2], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['adj_close'], np.array([3, 4], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['high'], np.array([5, 6], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['low'], np.array([7, 8], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['divs'], np.array([9, 10], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['split'], np.array([1, 14]))
+        np.testing.assert_array_equal(return_data['ts'], np.array([1669679999, 1672271999]))
+
+    def test_4_check_fetch_many(self):
+        source = yf.YF()
+
+        first_date = datetime(2022, 11, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+        last_date = datetime(2022, 12, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+
+        source.first_date = first_date
+        source.last_date = last_date
+        source.timespan = Timespans.Day
+
+        fields = ['Open', 'Close', 'High', 'Low', 'Dividends', 'Volume', 'Stock Splits']
+
+        df = pd.DataFrame([[1, 3, 5, 7, 9, 11, 0, None, None, None, None, None, None, None],
+                           [2, 4, 6, 8, 10, 12, 14, 15, 16, 17, 18, 0, 19, 2]],
+                          index=pd.Index([first_date, last_date], name='Date'),
+                          columns=pd.MultiIndex.from_product([['SPY', 'QQQ'], fields]))
+
+        # Mocking
+        with patch.object(yfinance, 'download', return_value=df) as m_download:
+            return_data = source.fetch_many(['SPY', 'QQQ'])
+
+        m_download.assert_called_once_with(tickers='SPY QQQ',
+                                           interval=source.get_timespan(),
+                                           group_by='ticker',
+                                           auto_adjust=True,
+                                           actions=True,
+                                           threads=True,
+                                           progress=False,
+                                           start=source.first_date_str,
+                                           end=source.last_date_str)
+
+        np.testing.assert_array_equal(return_data['SPY']['open'], np.array([1, 2], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['SPY']['split'], np.array([1, 14]))
+        np.testing.assert_array_equal(return_data['SPY']['ts'], np.array([1669679999, 1672271999]))
+
+        np.testing.assert_array_equal(return_data['QQQ']['open'], np.array([15], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['QQQ']['adj_close'], np.array([16], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['QQQ']['divs'], np.array([0], dtype=np.float64))
+        np.testing.assert_array_equal(return_data['QQQ']['ts'], np.array([1672271999]))
+
+    def test_5_check_fetch_many_aligned(self):
+        source = yf.YF()
+
+        first_date = datetime(2022, 11, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+        last_date = datetime(2022, 12, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+
+        source.first_date = first_date
+        source.last_date = last_date
+        source.timespan = Timespans.Day
+
+        fields = ['Open', 'Close', 'High', 'Low', 'Dividends', 'Volume', 'Stock Splits']
+
+        # YF aligns the dates for all the symbols and fills the missing quotes with NaN, so all the columns are float
+        nan = float('nan')
+
+        df = pd.DataFrame([[1.0, 3.0, 5.0, 7.0, 0.0, 11.0, 0.0, nan, nan, nan, nan, nan, nan, nan],
+                           [2.0, 4.0, 6.0, 8.0, 0.5, 12.0, 1.5, 15.0, 16.0, 17.0, 18.0, 0.0, 19.0, 0.0]],
+                          index=pd.Index([first_date, last_date], name='Date'),
+                          columns=pd.MultiIndex.from_product([['SPY', 'QQQ'], fields]))
+
+        with patch.object(yfinance, 'download', return_value=df):
+            return_data = source.fetch_many(['SPY', 'QQQ'])
+
+        with patch.object(yfinance, 'Ticker') as m_ticker:
+            m_ticker.return_value.history.return_value = df['SPY']
+            columns = source.fetch_columns()
+
+        for key in columns.keys():
+            assert return_data['SPY'][key].dtype == columns[key].dtype
+
+        assert return_data['SPY']['volume'].dtype == np.int64
+        assert return_data['SPY']['split'].dtype == np.float64
+
+        np.testing.assert_array_equal(return_data['SPY']['volume'], np.array([11, 12]))
+        np.testing.assert_array_equal(return_data['SPY']['split'], np.array([1, 1.5]))
+        np.testing.assert_array_equal(return_data['QQQ']['volume'], np.array([19]))
+        np.testing.assert_array_equal(return_data['QQQ']['split'], np.array([1]))
+
+    def test_6_check_fetch_columns_missing_volume(self):
+        source = yf.YF()
+        source.symbol = 'SPY'
+
+        first_date = datetime(2022, 11, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+        last_date = datetime(2022, 12, 28, 23, 55, 59).replace(tzinfo=pytz.utc)
+
+        source.first_date = first_date
+        source.last_date = last_date
+        source.timespan = Timespans.Day
+
+        df = pd.DataFrame({'Date': [first_date, last_date],
+                           'Open': [1, 2],
+                           'Close': [3, 4],
+                           'High': [5, 6],
+                           'Low': [7, 8],
+                           'Dividends': [9, float('nan')],
+                           'Volume': [float('nan'), 12],
+                           'Stock Splits': [0, 0]
+                         })
+        df = df.set_index('Date')
+
+        with patch.object(yfinance, 'Ticker') as m_ticker:
+            m_ticker.return_value.history.return_value = df
+            return_data = source.fetch_columns()
+
+        assert return_data['volume'].dtype == np.int64
+
+        np.testing.assert_array_equal(return_data['volume'], np.array([0, 12]))
+        np.testing.assert_array_equal(return_data['divs'], np.array([9, 0]))